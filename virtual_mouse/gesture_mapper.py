@@ -1,24 +1,50 @@
 # type: ignore
-import pyautogui
-import numpy as np
+import math
+import threading
 import time
+from collections import defaultdict, deque
+
+from input_backend import create_backend
+from utils import fingers_to_mask, pinch_distance_sq
+
+# Finger bitmasks (bit 0 = thumb ... bit 4 = pinky), see utils.fingers_to_mask
+FIST = 0b00000
+OPEN_PALM = 0b11111
+THUMB_ONLY = 0b00001
+CURSOR_MOVE = 0b00010
+SCROLL = 0b00110
+BRIGHTNESS = 0b01110
+INDEX_FINGER = 0b00010
+MIDDLE_FINGER = 0b00100
+
+# Backend calls sent every frame with the latest cursor position; these are
+# coalesced or dropped instead of blocking the capture loop
+_POSITION_CMDS = frozenset(("move", "drag_to"))
 
 class GestureMapper:
-    def __init__(self, screen_size, smoothing=8):
+    def __init__(self, screen_size, smoothing=8, backend=None):
         """
         Initialize the gesture mapper to convert hand gestures to mouse actions
         
         Args:
             screen_size: Tuple of (screen_width, screen_height)
             smoothing: Smoothing factor for mouse movement (higher = smoother but slower)
+            backend: Input backend from input_backend (platform default if None)
         """
         self.screen_width, self.screen_height = screen_size
         self.smoothing = smoothing
         self.prev_x, self.prev_y = 0, 0
         self.mode = "control"  # Modes: "control", "draw", "system"
         
-        # Prevent errors from mouse going outside screen
-        pyautogui.FAILSAFE = False
+        # Mouse/keyboard output backend
+        self.backend = backend if backend is not None else create_backend()
+        
+        # Backend calls run on a worker thread so input synthesis never
+        # blocks the capture loop; pending cursor moves are coalesced
+        self._cmd_q = deque()
+        self._cmd_max = 4
+        self._cmd_cond = threading.Condition()
+        threading.Thread(target=self._cmd_worker, daemon=True).start()
         
         # Frame rate tracking for gestures
         self.prev_time = 0
@@ -27,10 +53,11 @@ class GestureMapper:
         # States for gesture recognition
         self.scroll_active = False
         self.scroll_start_y = 0
-        self.prev_fingers = [0, 0, 0, 0, 0]
         
-        # Define pinch distance threshold
+        # Define pinch distance threshold; pinch checks compare integer
+        # squared pixel distances against the squared threshold
         self.pinch_threshold = 40
+        self.pinch_threshold_sq = self._threshold_sq(self.pinch_threshold)
         
         # System control variables
         self.volume_control_active = False
@@ -40,6 +67,32 @@ class GestureMapper:
         # Mode tracking
         self.last_mode_switch_time = 0
         self.mode_switch_cooldown = 1.0  # seconds
+        
+        # Per-action repeat cooldowns (seconds); checked against a monotonic
+        # clock so the capture loop never sleeps
+        self._cooldowns = {
+            "left_click": 0.3,
+            "right_click": 0.3,
+            "volume_up": 0.2,
+            "volume_down": 0.2,
+            "brightness_control": 0.5,
+        }
+        self._next_allowed = defaultdict(float)
+        
+        # Cached ((frame_shape, offset), scale_x, scale_y) for map_position
+        self._map_cache = None
+        
+        # Smoothed screen position for the current frame, computed on first use
+        self._frame_screen_pos = None
+        
+        # Control-mode handlers keyed by finger bitmask; any other pose
+        # only checks for click pinches
+        self._dispatch = {
+            CURSOR_MOVE: self._handle_move,
+            SCROLL: self._handle_scroll,
+            THUMB_ONLY: self._handle_volume,
+            BRIGHTNESS: self._handle_brightness,
+        }
 
     def map_position(self, index_finger_pos, frame_shape, offset=100, scale=1.5):
         """
@@ -57,15 +110,22 @@ class GestureMapper:
         frame_width, frame_height = frame_shape
         cam_x, cam_y = index_finger_pos
         
+        # Precompute the linear scale factors once per frame size
+        if self._map_cache is None or self._map_cache[0] != (frame_shape, offset):
+            scale_x = self.screen_width / max(1, frame_width - 2 * offset)
+            scale_y = self.screen_height / max(1, frame_height - 2 * offset)
+            self._map_cache = ((frame_shape, offset), scale_x, scale_y)
+        _, scale_x, scale_y = self._map_cache
+        
         # Convert from webcam coordinates to screen coordinates
         # Apply a border offset to create a control area
         # Mirror x-axis for intuitive movement
-        input_x = np.interp(cam_x, 
-                          (offset, frame_width - offset), 
-                          (self.screen_width, 0))
-        input_y = np.interp(cam_y, 
-                          (offset, frame_height - offset), 
-                          (0, self.screen_height))
+        input_x = (frame_width - offset - cam_x) * scale_x
+        input_y = (cam_y - offset) * scale_y
+        
+        # Clamp to the screen bounds
+        input_x = min(max(input_x, 0.0), self.screen_width - 1)
+        input_y = min(max(input_y, 0.0), self.screen_height - 1)
         
         # Apply smoothing
         smooth_x = self.prev_x + (input_x - self.prev_x) / self.smoothing
@@ -76,41 +136,66 @@ class GestureMapper:
         
         return smooth_x, smooth_y
     
+    def _screen_position(self, index_pos, frame_shape):
+        """
+        Map the index finger to the screen at most once per frame
+        
+        The smoothing step only advances on frames that actually use the
+        cursor position (moves, clicks, drawing), so static gestures don't
+        drift it.
+        
+        Args:
+            index_pos: (x, y) position of index finger tip
+            frame_shape: (frame_width, frame_height) from webcam
+        
+        Returns:
+            (screen_x, screen_y) coordinates
+        """
+        if self._frame_screen_pos is None:
+            self._frame_screen_pos = self.map_position(index_pos, frame_shape)
+        return self._frame_screen_pos
+    
+    @staticmethod
+    def _threshold_sq(threshold):
+        """
+        Square a pixel threshold for integer comparisons
+        
+        For an integer d2, d2 < ceil(t * t) exactly when d2 < t * t, so
+        fractional thresholds keep their meaning.
+        """
+        return int(math.ceil(threshold * threshold))
+    
     def check_pinch(self, landmarks, finger1, finger2, threshold=None):
         """
         Check if two fingers are pinching
         
         Args:
-            landmarks: List of landmark positions
+            landmarks: Landmark array from HandDetector.find_position
             finger1: Index of first finger landmark (tip)
             finger2: Index of second finger landmark (tip)
             threshold: Optional custom threshold
             
         Returns:
-            Boolean indicating if pinch detected and distance
+            Boolean indicating if pinch detected and squared distance
         """
         if len(landmarks) <= max(finger1, finger2):
             return False, None
             
-        # Get coordinates of finger tips
-        x1, y1 = landmarks[finger1][1:]
-        x2, y2 = landmarks[finger2][1:]
-        
-        # Calculate distance
-        distance = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+        # Squared distance between finger tips
+        distance_sq = int(pinch_distance_sq(landmarks, finger1, finger2))
         
         # Use custom threshold if provided, otherwise use default
-        pinch_threshold = threshold if threshold is not None else self.pinch_threshold
+        threshold_sq = self._threshold_sq(threshold) if threshold is not None else self.pinch_threshold_sq
         
         # Return True if pinching (distance below threshold)
-        return distance < pinch_threshold, distance
+        return distance_sq < threshold_sq, distance_sq
     
     def check_three_finger_pinch(self, landmarks, finger1, finger2, finger3):
         """
         Check if three fingers are close together (pinching)
         
         Args:
-            landmarks: List of landmark positions
+            landmarks: Landmark array from HandDetector.find_position
             finger1, finger2, finger3: Indices of finger landmarks (tips)
             
         Returns:
@@ -127,13 +212,13 @@ class GestureMapper:
         # All three fingers must be close to each other
         return pinch1_2 and pinch1_3 and pinch2_3
     
-    def is_thumb_up(self, landmarks, fingers):
+    def is_thumb_up(self, landmarks, mask):
         """
         Check if thumb is pointing up (👍)
         
         Args:
-            landmarks: List of landmark positions
-            fingers: List of which fingers are up
+            landmarks: Landmark array from HandDetector.find_position
+            mask: Bitmask of which fingers are up
             
         Returns:
             Boolean indicating if thumb is up
@@ -142,23 +227,23 @@ class GestureMapper:
             return False
             
         # Thumb must be up, others folded
-        if fingers[0] != 1 or fingers[1] != 0 or fingers[2] != 0 or fingers[3] != 0 or fingers[4] != 0:
+        if mask != THUMB_ONLY:
             return False
             
         # Check thumb orientation by comparing y coordinates
-        thumb_tip_y = landmarks[4][2]
-        thumb_ip_y = landmarks[3][2]
+        thumb_tip_y = landmarks[4, 2]
+        thumb_ip_y = landmarks[3, 2]
         
         # Thumb tip should be significantly higher than the IP joint for "thumb up"
         return thumb_tip_y < thumb_ip_y - 30
     
-    def is_thumb_down(self, landmarks, fingers):
+    def is_thumb_down(self, landmarks, mask):
         """
         Check if thumb is pointing down (👎)
         
         Args:
-            landmarks: List of landmark positions
-            fingers: List of which fingers are up
+            landmarks: Landmark array from HandDetector.find_position
+            mask: Bitmask of which fingers are up
             
         Returns:
             Boolean indicating if thumb is down
@@ -167,163 +252,257 @@ class GestureMapper:
             return False
             
         # Thumb must be up, others folded
-        if fingers[0] != 1 or fingers[1] != 0 or fingers[2] != 0 or fingers[3] != 0 or fingers[4] != 0:
+        if mask != THUMB_ONLY:
             return False
             
         # Check thumb orientation by comparing y coordinates
-        thumb_tip_y = landmarks[4][2]
-        thumb_ip_y = landmarks[3][2]
+        thumb_tip_y = landmarks[4, 2]
+        thumb_ip_y = landmarks[3, 2]
         
         # Thumb tip should be significantly lower than the IP joint for "thumb down"
         return thumb_tip_y > thumb_ip_y + 30
     
-    def is_fist(self, fingers):
+    def is_fist(self, mask):
         """
         Check if hand is in a fist (all fingers folded)
         
         Args:
-            fingers: List of which fingers are up
+            mask: Bitmask of which fingers are up
             
         Returns:
             Boolean indicating if fist detected
         """
-        return fingers == [0, 0, 0, 0, 0]
+        return mask == FIST
     
-    def is_open_palm(self, fingers):
+    def is_open_palm(self, mask):
         """
         Check if hand is an open palm (all fingers extended)
         
         Args:
-            fingers: List of which fingers are up
+            mask: Bitmask of which fingers are up
             
         Returns:
             Boolean indicating if open palm detected
         """
-        return fingers == [1, 1, 1, 1, 1]
+        return mask == OPEN_PALM
+    
+    def _send(self, cmd, *args, **kwargs):
+        """
+        Queue an input backend call for the worker thread
+        
+        Args:
+            cmd: Name of the backend method to call
+            *args, **kwargs: Arguments for the call
+        """
+        entry = (cmd, args, kwargs)
+        with self._cmd_cond:
+            if cmd in _POSITION_CMDS:
+                if self._cmd_q and self._cmd_q[-1][0] == cmd:
+                    # Same call still waiting at the tail; only the newest
+                    # position matters, and nothing queued after it is reordered
+                    self._cmd_q[-1] = entry
+                elif len(self._cmd_q) < self._cmd_max:
+                    self._cmd_q.append(entry)
+                # Otherwise drop it rather than build a backlog or block
+            else:
+                # Clicks and key presses must not be lost; wait for room
+                self._cmd_cond.wait_for(lambda: len(self._cmd_q) < self._cmd_max)
+                self._cmd_q.append(entry)
+            self._cmd_cond.notify_all()
+    
+    def _cmd_worker(self):
+        """
+        Execute queued backend calls in order
+        """
+        while True:
+            with self._cmd_cond:
+                self._cmd_cond.wait_for(lambda: self._cmd_q)
+                cmd, args, kwargs = self._cmd_q.popleft()
+                self._cmd_cond.notify_all()
+            try:
+                getattr(self.backend, cmd)(*args, **kwargs)
+            except Exception as e:
+                print(f"Error running input command {cmd}: {e}")
+    
+    def _cooldown_ready(self, action):
+        """
+        Check whether an action may fire again and start its cooldown if so
+        
+        Args:
+            action: Action name from self._cooldowns
+            
+        Returns:
+            Boolean indicating if the action is allowed now
+        """
+        now = self.current_time
+        if now < self._next_allowed[action]:
+            return False
+        self._next_allowed[action] = now + self._cooldowns[action]
+        return True
+    
+    def _handle_pinch(self, landmarks, mask, index_pos, frame_shape):
+        """
+        Handle the click pinches, which can occur in any control-mode pose
+        
+        Args:
+            landmarks: Landmark array from HandDetector.find_position
+            mask: Bitmask of which fingers are up
+            index_pos: (x, y) position of index finger tip
+            frame_shape: Dimensions of the camera frame (width, height)
+            
+        Returns:
+            "left_click", "right_click" or None
+        """
+        action = None
+        
+        # Left Click: Index + Thumb Pinch (middle finger must be down)
+        if not mask & MIDDLE_FINGER and self.check_pinch(landmarks, 4, 8)[0]:  # 4=thumb tip, 8=index tip
+            # Cooldown prevents multiple clicks
+            if self._cooldown_ready("left_click"):
+                screen_x, screen_y = self._screen_position(index_pos, frame_shape)
+                self._send("click", screen_x, screen_y)
+                action = "left_click"
+        
+        # Right Click: Index + Middle + Thumb Touching (three-finger pinch)
+        if self.check_three_finger_pinch(landmarks, 4, 8, 12):  # thumb, index, middle
+            # Cooldown prevents multiple clicks
+            if self._cooldown_ready("right_click"):
+                screen_x, screen_y = self._screen_position(index_pos, frame_shape)
+                self._send("right_click", screen_x, screen_y)
+                action = "right_click"
+        
+        return action
+    
+    def _handle_move(self, landmarks, mask, index_pos, frame_shape):
+        """
+        Cursor Movement: Only Index Finger Up
+        """
+        screen_x, screen_y = self._screen_position(index_pos, frame_shape)
+        self._send("move", screen_x, screen_y)
+        return self._handle_pinch(landmarks, mask, index_pos, frame_shape) or "move"
+    
+    def _handle_scroll(self, landmarks, mask, index_pos, frame_shape):
+        """
+        Scroll Mode: Index + Middle Extended
+        """
+        action = self._handle_pinch(landmarks, mask, index_pos, frame_shape)
+        index_y = index_pos[1]
+        
+        # Enter scroll mode or continue scrolling
+        if not self.scroll_active:
+            self.scroll_active = True
+            self.scroll_start_y = index_y
+        else:
+            # Determine scroll direction and amount
+            scroll_amount = (self.scroll_start_y - index_y) / 5
+            if abs(scroll_amount) > 1:
+                self._send("scroll", int(scroll_amount))
+                action = "scroll_" + ("up" if scroll_amount > 0 else "down")
+                # Reset start position for continuous scrolling
+                self.scroll_start_y = index_y
+        return action
+    
+    def _handle_volume(self, landmarks, mask, index_pos, frame_shape):
+        """
+        Volume Up/Down: Thumb Up (👍) / Thumb Down (👎)
+        """
+        action = self._handle_pinch(landmarks, mask, index_pos, frame_shape)
+        
+        # Cooldown prevents rapid fire
+        if self.is_thumb_up(landmarks, mask):
+            if self._cooldown_ready("volume_up"):
+                self._send("press", 'volumeup')
+                action = "volume_up"
+        elif self.is_thumb_down(landmarks, mask):
+            if self._cooldown_ready("volume_down"):
+                self._send("press", 'volumedown')
+                action = "volume_down"
+        return action
+    
+    def _handle_brightness(self, landmarks, mask, index_pos, frame_shape):
+        """
+        Brightness Control: Index + Middle + Ring Up
+        """
+        self._handle_pinch(landmarks, mask, index_pos, frame_shape)
+        
+        # This would typically launch the system brightness control
+        # For Windows, could use keyboard shortcut Win+A to open action center
+        if not self.brightness_control_active and self._cooldown_ready("brightness_control"):
+            self.brightness_control_active = True
+            self._send("hotkey", 'win', 'a')
+        return "brightness_control"
     
     def interpret_gestures(self, landmarks, fingers, frame_shape):
         """
         Interpret hand landmarks and finger positions to determine mouse actions
         
         Args:
-            landmarks: List of landmark positions [id, x, y]
+            landmarks: Landmark array [id, x, y] from HandDetector.find_position
             fingers: List of which fingers are up [thumb, index, middle, ring, pinky]
             frame_shape: Dimensions of the camera frame (width, height)
         
         Returns:
             Action to perform
         """
+        # Read the clock once per frame; cooldown checks reuse self.current_time
+        now = time.monotonic()
+        
         # Calculate current frame rate
-        self.current_time = time.time()
-        fps = 1 / (self.current_time - self.prev_time) if self.prev_time > 0 else 0
-        self.prev_time = self.current_time
+        self.current_time = now
+        fps = 1 / (now - self.prev_time) if self.prev_time > 0 else 0
+        self.prev_time = now
         
-        frame_width, frame_height = frame_shape
         action = None
+        mask = fingers_to_mask(fingers)
+        self._frame_screen_pos = None
         
         # Check if we have index finger position
         if len(landmarks) > 8:
-            index_x, index_y = landmarks[8][1:]  # Index fingertip
+            index_x, index_y = int(landmarks[8, 1]), int(landmarks[8, 2])  # Index fingertip
             
             # MODE SWITCHING
             # ---------------
             # Switch to Draw Mode: Open Palm
-            if self.is_open_palm(fingers) and time.time() - self.last_mode_switch_time > self.mode_switch_cooldown:
+            if self.is_open_palm(mask) and now - self.last_mode_switch_time > self.mode_switch_cooldown:
                 self.mode = "draw"
                 action = "switch_to_draw"
-                self.last_mode_switch_time = time.time()
+                self.last_mode_switch_time = now
                 
             # Switch to Control Mode: Fist
-            elif self.is_fist(fingers) and time.time() - self.last_mode_switch_time > self.mode_switch_cooldown:
+            elif self.is_fist(mask) and now - self.last_mode_switch_time > self.mode_switch_cooldown:
                 self.mode = "control"
                 action = "switch_to_control"
-                self.last_mode_switch_time = time.time()
+                self.last_mode_switch_time = now
             
             # CONTROL MODE ACTIONS
             # -------------------
             if self.mode == "control":
-                # Cursor Movement: Only Index Finger Up
-                if fingers == [0, 1, 0, 0, 0]:
-                    screen_x, screen_y = self.map_position((index_x, index_y), (frame_width, frame_height))
-                    pyautogui.moveTo(screen_x, screen_y)
-                    action = "move"
-                
-                # Left Click: Index + Thumb Pinch
-                pinching_thumb_index, _ = self.check_pinch(landmarks, 4, 8)  # 4=thumb tip, 8=index tip
-                if pinching_thumb_index and fingers[2] == 0:  # Make sure middle finger is down
-                    screen_x, screen_y = self.map_position((index_x, index_y), (frame_width, frame_height))
-                    pyautogui.click(screen_x, screen_y)
-                    action = "left_click"
-                    # Add a small delay to prevent multiple clicks
-                    time.sleep(0.3)
-                
-                # Right Click: Index + Middle + Thumb Touching (three-finger pinch)
-                if self.check_three_finger_pinch(landmarks, 4, 8, 12):  # thumb, index, middle
-                    screen_x, screen_y = self.map_position((index_x, index_y), (frame_width, frame_height))
-                    pyautogui.rightClick(screen_x, screen_y)
-                    action = "right_click"
-                    # Add a small delay to prevent multiple clicks
-                    time.sleep(0.3)
+                handler = self._dispatch.get(mask, self._handle_pinch)
+                control_action = handler(landmarks, mask, (index_x, index_y), frame_shape)
+                if control_action is not None:
+                    action = control_action
                 
-                # Scroll Mode: Index + Middle Extended
-                if fingers == [0, 1, 1, 0, 0]:
-                    # Enter scroll mode or continue scrolling
-                    if not self.scroll_active:
-                        self.scroll_active = True
-                        self.scroll_start_y = index_y
-                    else:
-                        # Determine scroll direction and amount
-                        scroll_amount = (self.scroll_start_y - index_y) / 5
-                        if abs(scroll_amount) > 1:
-                            pyautogui.scroll(int(scroll_amount))
-                            action = "scroll_" + ("up" if scroll_amount > 0 else "down")
-                            # Reset start position for continuous scrolling
-                            self.scroll_start_y = index_y
-                else:
+                # Leave scroll/brightness state once the pose is released
+                if mask != SCROLL:
                     self.scroll_active = False
-                
-                # Volume Up: Thumb Up (👍)
-                if self.is_thumb_up(landmarks, fingers):
-                    pyautogui.press('volumeup')
-                    action = "volume_up"
-                    time.sleep(0.2)  # Prevent rapid fire
-                
-                # Volume Down: Thumb Down (👎)
-                if self.is_thumb_down(landmarks, fingers):
-                    pyautogui.press('volumedown')
-                    action = "volume_down"
-                    time.sleep(0.2)  # Prevent rapid fire
-                
-                # Brightness Control: Index + Middle + Ring Up
-                if fingers == [0, 1, 1, 1, 0]:
-                    action = "brightness_control"
-                    # This would typically launch the system brightness control
-                    # For Windows, could use keyboard shortcut Win+A to open action center
-                    if not self.brightness_control_active:
-                        self.brightness_control_active = True
-                        pyautogui.hotkey('win', 'a')
-                        time.sleep(0.5)
-                else:
+                if mask != BRIGHTNESS:
                     self.brightness_control_active = False
             
             # DRAW MODE ACTIONS
             # ----------------
             elif self.mode == "draw":
                 # Draw with index finger
-                if fingers[1] == 1:
-                    screen_x, screen_y = self.map_position((index_x, index_y), (frame_width, frame_height))
-                    pyautogui.moveTo(screen_x, screen_y)
-                    pyautogui.dragTo(screen_x, screen_y, button='left')
+                if mask & INDEX_FINGER:
+                    screen_x, screen_y = self._screen_position((index_x, index_y), frame_shape)
+                    self._send("move", screen_x, screen_y)
+                    self._send("drag_to", screen_x, screen_y)
                     action = "draw"
                     
                 # Stop drawing (switch back to control mode or when in fist position)
-                if self.is_fist(fingers):
-                    pyautogui.mouseUp()
+                if self.is_fist(mask):
+                    self._send("mouse_up")
                     action = "stop_draw"
         
-        # Store current fingers state
-        self.prev_fingers = fingers.copy()
-        
         return action, self.mode
     
     def get_mode(self):
@@ -1,10 +1,14 @@
 # type: ignore
 import cv2
 import mediapipe as mp
+import numpy as np
 import time
 
+from utils import fingers_up_mask
+
 class HandDetector:
-    def __init__(self, mode=False, max_hands=1, detection_con=0.5, track_con=0.5):
+    def __init__(self, mode=False, max_hands=1, detection_con=0.5, track_con=0.5, model_complexity=None,
+                 infer_width=320):
         """
         Initialize the hand detector with MediaPipe
         
@@ -13,11 +17,21 @@ class HandDetector:
             max_hands: Maximum number of hands to detect
             detection_con: Minimum detection confidence
             track_con: Minimum tracking confidence
+            model_complexity: 0 for the lite model (roughly half the inference
+                time, slightly less accurate landmarks) or 1 for the full model.
+                Defaults to 0 for video streams and 1 for static images.
+            infer_width: Width frames are downscaled to (keeping aspect ratio)
+                before inference, or None to process frames at full size.
+                Landmarks are normalized, so results are unaffected.
         """
         self.mode = mode
         self.max_hands = max_hands
         self.detection_con = detection_con
         self.track_con = track_con
+        if model_complexity is None:
+            model_complexity = 1 if mode else 0
+        self.model_complexity = model_complexity
+        self.infer_width = infer_width
         
         # Print mediapipe version for debugging
         print(f"MediaPipe version: {mp.__version__}")
@@ -30,17 +44,29 @@ class HandDetector:
                 max_num_hands=self.max_hands,
                 min_detection_confidence=self.detection_con,
                 min_tracking_confidence=self.track_con,
-                model_complexity=1  # Use higher complexity model for better accuracy
+                model_complexity=self.model_complexity
             )
             self.mp_draw = mp.solutions.drawing_utils
             self.mp_drawing_styles = mp.solutions.drawing_styles
+            self._landmark_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+            self._connection_style = self.mp_drawing_styles.get_default_hand_connections_style()
             
             # Define special finger landmark indices
             self.tip_ids = [4, 8, 12, 16, 20]  # thumb, index, middle, ring, pinky fingertips
+            self._gesture_tip_ids = [4, 8, 12]  # thumb, index and middle tips the gesture mapper reads
+            self._landmark_ids = np.arange(21, dtype=np.int32)
             
             # Initialize hand tracking state
             self.results = None
             self.hands_detected = False
+            self.landmark_array = np.empty((0, 3), dtype=np.int32)
+            self._rgb_buf = None
+            self._small_buf = None
+            
+            # Pixel coordinates of each detected hand, converted once per
+            # frame in find_hands and reused by find_position
+            self._hand_pixels = []
+            self._pixels_size = None
             
             print("MediaPipe hand tracking initialized successfully")
         except Exception as e:
@@ -62,43 +88,96 @@ class HandDetector:
             print("Warning: Received empty image")
             return img
             
-        # Convert BGR image to RGB
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        img_h, img_w = img.shape[:2]
+        
+        # Downscale before inference; fewer pixels to convert and preprocess.
+        # Like the RGB buffer below, the target is reused across frames
+        small = img
+        if self.infer_width and img_w > self.infer_width:
+            infer_size = (self.infer_width, max(1, img_h * self.infer_width // img_w))
+            small_shape = (infer_size[1], infer_size[0]) + img.shape[2:]
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=img.dtype)
+            small = cv2.resize(img, infer_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
         
-        # Process the image with MediaPipe
+        # Convert BGR image to RGB into a buffer reused across frames; the BGR
+        # frame itself is left untouched for the overlays drawn on it
+        if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+            self._rgb_buf = np.empty_like(small)
+        self._rgb_buf.flags.writeable = True
+        img_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # Marking it read-only lets MediaPipe use the buffer by reference
+        # instead of copying it
+        img_rgb.flags.writeable = False
+        
+        # In video mode MediaPipe crops to the hand tracked in the previous
+        # frame and only reruns palm detection when tracking is lost
         self.results = self.hands.process(img_rgb)
         self.hands_detected = self.results.multi_hand_landmarks is not None
         
+        # Convert landmarks to pixel coordinates once for the bbox and find_position
+        self._hand_pixels = []
+        self._pixels_size = (img_w, img_h)
+        if self.hands_detected:
+            self._hand_pixels = [self._landmark_pixels(hand_landmarks, img_w, img_h)
+                                 for hand_landmarks in self.results.multi_hand_landmarks]
+        
         # Draw hand landmarks if hands are detected
         if self.hands_detected and draw:
-            for hand_landmarks in self.results.multi_hand_landmarks:
+            for hand_landmarks, pts_i in zip(self.results.multi_hand_landmarks, self._hand_pixels):
                 # Draw skeleton
                 self.mp_draw.draw_landmarks(
                     img, 
                     hand_landmarks, 
                     self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
+                    self._landmark_style,
+                    self._connection_style
                 )
                 
                 # Add a rectangle around the hand for better visibility
-                x_min, y_min = img.shape[1], img.shape[0]
-                x_max, y_max = 0, 0
-                for lm in hand_landmarks.landmark:
-                    x, y = int(lm.x * img.shape[1]), int(lm.y * img.shape[0])
-                    x_min, y_min = min(x_min, x), min(y_min, y)
-                    x_max, y_max = max(x_max, x), max(y_max, y)
-                
-                # Add padding
-                padding = 20
-                x_min, y_min = max(0, x_min - padding), max(0, y_min - padding)
-                x_max, y_max = min(img.shape[1], x_max + padding), min(img.shape[0], y_max + padding)
+                x_min, y_min, x_max, y_max = self._hand_bbox(pts_i, img_w, img_h, padding=20)
                 
                 # Draw rectangle
                 cv2.rectangle(img, (x_min, y_min), (x_max, y_max), (255, 0, 255), 2)
                 
         return img
     
+    def _landmark_pixels(self, hand_landmarks, img_w, img_h):
+        """
+        Convert one hand's normalized landmarks to pixel coordinates
+        
+        Args:
+            hand_landmarks: MediaPipe landmarks for one hand
+            img_w, img_h: Image dimensions
+        
+        Returns:
+            int32 array of (x, y) pixel coordinates with shape (21, 2)
+        """
+        pts = np.array([(lm.x, lm.y) for lm in hand_landmarks.landmark], dtype=np.float32)
+        pts *= (img_w, img_h)
+        return pts.astype(np.int32)
+    
+    def _hand_bbox(self, pts_i, img_w, img_h, padding=20):
+        """
+        Compute the pixel bounding box of a hand, clipped to the image
+        
+        Args:
+            pts_i: Pixel coordinates from _landmark_pixels
+            img_w, img_h: Image dimensions
+            padding: Extra pixels to add on each side
+        
+        Returns:
+            (x_min, y_min, x_max, y_max)
+        """
+        x_min, y_min = pts_i.min(axis=0).tolist()
+        x_max, y_max = pts_i.max(axis=0).tolist()
+        
+        # Add padding
+        x_min, y_min = max(0, x_min - padding), max(0, y_min - padding)
+        x_max, y_max = min(img_w, x_max + padding), min(img_h, y_max + padding)
+        return x_min, y_min, x_max, y_max
+    
     def find_position(self, img, hand_no=0, draw=True):
         """
         Find the positions of landmarks for a specific hand
@@ -106,70 +185,58 @@ class HandDetector:
         Args:
             img: Image to process
             hand_no: Which hand to get positions for (if multiple detected)
-            draw: Whether to draw circles at landmark positions
+            draw: Whether to draw circles at the thumb, index and middle fingertips
         
         Returns:
-            List of landmark positions [id, x, y]
+            Array of landmark positions [id, x, y] with shape (21, 3), or an
+            empty (0, 3) array if no hand was found
         """
-        landmark_list = []
+        self.landmark_array = np.empty((0, 3), dtype=np.int32)
         
         if img is None:
-            return landmark_list
+            return self.landmark_array
             
         img_height, img_width, _ = img.shape
         
         if self.results and self.results.multi_hand_landmarks:
             # Check if the requested hand exists
             if hand_no < len(self.results.multi_hand_landmarks):
-                hand = self.results.multi_hand_landmarks[hand_no]
+                # Reuse the coordinates from find_hands unless the image size changed
+                if self._pixels_size == (img_width, img_height) and hand_no < len(self._hand_pixels):
+                    pts_i = self._hand_pixels[hand_no]
+                else:
+                    hand = self.results.multi_hand_landmarks[hand_no]
+                    pts_i = self._landmark_pixels(hand, img_width, img_height)
+                # One contiguous (21, 3) buffer filled column-wise; callers index
+                # it as landmarks[id, 1] / landmarks[id, 2] and may write into it
+                self.landmark_array = np.empty((len(pts_i), 3), dtype=np.int32)
+                self.landmark_array[:, 0] = self._landmark_ids[:len(pts_i)]
+                self.landmark_array[:, 1:] = pts_i
                 
-                # Extract all landmark positions
-                for id, lm in enumerate(hand.landmark):
-                    # Convert normalized coordinates to pixel coordinates
-                    cx, cy = int(lm.x * img_width), int(lm.y * img_height)
-                    landmark_list.append([id, cx, cy])
-                    
-                    # Draw circles at landmark positions if requested
-                    if draw:
-                        # Use different colors for fingertips
-                        if id in self.tip_ids:
-                            cv2.circle(img, (cx, cy), 9, (255, 0, 0), cv2.FILLED)  # Blue for fingertips
-                        else:
-                            cv2.circle(img, (cx, cy), 5, (255, 0, 255), cv2.FILLED)  # Pink for other landmarks
-        
-        return landmark_list
+                # Draw only the fingertips the gestures use, if requested
+                if draw:
+                    for id in self._gesture_tip_ids:
+                        x, y = pts_i[id]
+                        cv2.circle(img, (int(x), int(y)), 9, (255, 0, 0), cv2.FILLED)  # Blue for fingertips
+        
+        return self.landmark_array
     
     def fingers_up(self, landmarks):
         """
         Determine which fingers are up based on landmarks
         
         Args:
-            landmarks: List of landmark positions
+            landmarks: Landmark array from find_position
         
         Returns:
             List of 5 binary values indicating if each finger is up
         """
-        fingers = []
-        
         # Check if landmarks list contains enough points
         if len(landmarks) < 21:
             return [0, 0, 0, 0, 0]
         
-        # Thumb: compare x position of tip with x position of thumb IP
-        # Adjusted for both left and right hands
-        if landmarks[self.tip_ids[0]][1] < landmarks[self.tip_ids[0] - 1][1]:
-            fingers.append(1)
-        else:
-            fingers.append(0)
-        
-        # Other fingers: compare y position of tip with y position of PIP joint (2nd joint)
-        for id in range(1, 5):
-            if landmarks[self.tip_ids[id]][2] < landmarks[self.tip_ids[id] - 2][2]:
-                fingers.append(1)
-            else:
-                fingers.append(0)
-        
-        return fingers
+        mask = fingers_up_mask(landmarks)
+        return [mask & 1, mask >> 1 & 1, mask >> 2 & 1, mask >> 3 & 1, mask >> 4 & 1]
     
     def find_distance(self, p1, p2, img=None, draw=True, r=10, t=3):
         """
@@ -0,0 +1,134 @@
+# type: ignore
+import sys
+
+import pyautogui
+
+class PyAutoGUIBackend:
+    """
+    Mouse and keyboard output through pyautogui, with its per-call pause disabled
+    """
+    def __init__(self):
+        # pyautogui sleeps PAUSE seconds (0.1 by default) after every call
+        pyautogui.PAUSE = 0
+        
+        # Prevent errors from mouse going outside screen
+        pyautogui.FAILSAFE = False
+    
+    def move(self, x, y):
+        """Move the cursor to screen coordinates (x, y)"""
+        pyautogui.moveTo(x, y)
+    
+    def click(self, x, y):
+        """Left-click at screen coordinates (x, y)"""
+        pyautogui.click(x, y)
+    
+    def right_click(self, x, y):
+        """Right-click at screen coordinates (x, y)"""
+        pyautogui.rightClick(x, y)
+    
+    def scroll(self, clicks):
+        """Scroll the wheel by a number of clicks (positive = up)"""
+        pyautogui.scroll(clicks)
+    
+    def drag_to(self, x, y):
+        """Drag with the left button held to screen coordinates (x, y)"""
+        pyautogui.dragTo(x, y, button='left')
+    
+    def mouse_up(self):
+        """Release the left mouse button"""
+        pyautogui.mouseUp()
+    
+    def press(self, key):
+        """Press and release a key"""
+        pyautogui.press(key)
+    
+    def hotkey(self, *keys):
+        """Press a key combination"""
+        pyautogui.hotkey(*keys)
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    
+    _INPUT_MOUSE = 0
+    _MOUSEEVENTF_MOVE = 0x0001
+    _MOUSEEVENTF_LEFTDOWN = 0x0002
+    _MOUSEEVENTF_LEFTUP = 0x0004
+    _MOUSEEVENTF_RIGHTDOWN = 0x0008
+    _MOUSEEVENTF_RIGHTUP = 0x0010
+    _MOUSEEVENTF_WHEEL = 0x0800
+    _MOUSEEVENTF_ABSOLUTE = 0x8000
+    
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG),
+                    ("dy", wintypes.LONG),
+                    ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.c_void_p)]
+    
+    # MOUSEINPUT is the largest member of the INPUT union, so the struct size matches
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD),
+                    ("mi", _MOUSEINPUT)]
+    
+    class SendInputBackend(PyAutoGUIBackend):
+        """
+        Mouse output straight through the Win32 SendInput API
+        
+        This is the call pyautogui ends up making, without its per-call
+        bookkeeping. Keyboard output still goes through pyautogui.
+        """
+        def __init__(self):
+            super().__init__()
+            self._send_input = ctypes.windll.user32.SendInput
+            get_metrics = ctypes.windll.user32.GetSystemMetrics
+            self._screen_w, self._screen_h = get_metrics(0), get_metrics(1)
+        
+        def _mouse(self, *events):
+            """Send (flags, dx, dy, data) mouse events in one SendInput call"""
+            inputs = (_INPUT * len(events))()
+            for inp, (flags, dx, dy, data) in zip(inputs, events):
+                inp.type = _INPUT_MOUSE
+                inp.mi = _MOUSEINPUT(dx, dy, data & 0xFFFFFFFF, flags, 0, None)
+            self._send_input(len(events), inputs, ctypes.sizeof(_INPUT))
+        
+        def _move_event(self, x, y):
+            # Absolute coordinates are normalized to 0-65535 across the primary screen
+            dx = int(x) * 65535 // max(1, self._screen_w - 1)
+            dy = int(y) * 65535 // max(1, self._screen_h - 1)
+            return (_MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE, dx, dy, 0)
+        
+        def move(self, x, y):
+            self._mouse(self._move_event(x, y))
+        
+        def click(self, x, y):
+            self._mouse(self._move_event(x, y),
+                        (_MOUSEEVENTF_LEFTDOWN, 0, 0, 0),
+                        (_MOUSEEVENTF_LEFTUP, 0, 0, 0))
+        
+        def right_click(self, x, y):
+            self._mouse(self._move_event(x, y),
+                        (_MOUSEEVENTF_RIGHTDOWN, 0, 0, 0),
+                        (_MOUSEEVENTF_RIGHTUP, 0, 0, 0))
+        
+        def scroll(self, clicks):
+            # Same wheel units pyautogui sends on Windows
+            self._mouse((_MOUSEEVENTF_WHEEL, 0, 0, int(clicks)))
+        
+        def mouse_up(self):
+            self._mouse((_MOUSEEVENTF_LEFTUP, 0, 0, 0))
+
+def create_backend():
+    """
+    Pick the lowest-overhead input backend for this platform
+    
+    Returns:
+        SendInputBackend on Windows, PyAutoGUIBackend elsewhere
+    """
+    if sys.platform == "win32":
+        try:
+            return SendInputBackend()
+        except Exception as e:
+            print(f"SendInput backend unavailable, using pyautogui: {e}")
+    return PyAutoGUIBackend()
@@ -1,46 +1,48 @@
 # type: ignore
 import cv2
 import pyautogui
-import numpy as np
 import time
 import argparse
 import os
 import sys
+from collections import deque
 
 # Reduce TensorFlow logging
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 
+# Keep TFLite's XNNPACK CPU delegate on for MediaPipe inference; this must be
+# set before mediapipe is imported
+os.environ['TF_LITE_DISABLE_XNNPACK'] = '0'
+
 from hand_tracking import HandDetector
 from gesture_mapper import GestureMapper
-from utils import draw_info_panel, KalmanFilter, ExponentialMovingAverage
+from utils import draw_info_panel, KalmanFilter, SimdKalmanFilter, ExponentialMovingAverage, CameraStream, HAVE_SIMDKALMAN, try_camera_indices
 
-def try_camera_indices():
-    """Try different camera indices to find a working camera"""
-    for i in range(5):  # Try indices 0-4
-        print(f"Trying camera index {i}...")
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            ret, frame = cap.read()
-            if ret:
-                print(f"Success! Camera opened with index {i}")
-                cap.release()
-                return i
-            cap.release()
-        print(f"Camera index {i} failed.")
-    return 0  # Default to 0 if no camera found
+def non_negative_int(value):
+    """argparse type for integer options that must be >= 0"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
 
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Gesture-Controlled Virtual Mouse')
     parser.add_argument('--smoothing', type=str, default='ema', 
-                        choices=['none', 'ema', 'kalman'],
-                        help='Smoothing method to use (none, ema, kalman)')
+                        choices=['none', 'ema', 'kalman', 'simdkalman'],
+                        help='Smoothing method to use (none, ema, kalman, simdkalman)')
     parser.add_argument('--camera', type=int, default=None,
                         help='Camera index to use (will auto-detect if not specified)')
     parser.add_argument('--smooth-factor', type=float, default=8.0,
                         help='Smoothing factor (higher = smoother but slower)')
     parser.add_argument('--detector-confidence', type=float, default=0.7,
                         help='Hand detector confidence threshold (0.0-1.0)')
+    parser.add_argument('--model-complexity', type=int, default=0, choices=[0, 1],
+                        help='MediaPipe hand model (0 = lite/faster, 1 = full/more accurate)')
+    parser.add_argument('--infer-width', type=non_negative_int, default=320,
+                        help='Width frames are downscaled to for hand tracking (0 = full resolution)')
+    parser.add_argument('--show-landmarks', action='store_true',
+                        help='Draw the hand skeleton and gesture fingertips on the preview')
     args = parser.parse_args()
     
     # Check OpenCV version
@@ -59,6 +61,11 @@ def main():
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
     cap.set(cv2.CAP_PROP_FPS, 30)
     
+    # Keep the driver queue shallow so reads return the newest frame
+    # (MJPEG helps on backends that ignore the buffer size)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    
     # Check if camera opened successfully
     if not cap.isOpened():
         print("Error: Could not open webcam. Please check your camera connection.")
@@ -79,7 +86,17 @@ def main():
     # Initialize hand detector
     print(f"Initializing hand detector with confidence threshold {args.detector_confidence}...")
     try:
-        detector = HandDetector(detection_con=args.detector_confidence, max_hands=1)
+        # Video (tracking) mode: MediaPipe reuses the previous frame's hand
+        # landmarks as the ROI and only reruns palm detection when tracking
+        # confidence drops, so the detector must be created once, up front
+        detector = HandDetector(
+            mode=False,
+            detection_con=args.detector_confidence,
+            track_con=0.5,
+            max_hands=1,
+            model_complexity=args.model_complexity,
+            infer_width=args.infer_width
+        )
     except Exception as e:
         print(f"Error initializing hand detector: {e}")
         print("Please check that mediapipe is installed correctly.")
@@ -93,7 +110,17 @@ def main():
     )
     
     # Initialize the appropriate smoothing filter
-    if args.smoothing == 'kalman':
+    if args.smoothing == 'simdkalman' and not HAVE_SIMDKALMAN:
+        print("simdkalman is not installed, falling back to the built-in Kalman filter")
+        args.smoothing = 'kalman'
+    
+    if args.smoothing == 'simdkalman':
+        print("Using simdkalman Kalman filter for smoothing")
+        position_filter = SimdKalmanFilter(
+            process_variance=1e-5,
+            measurement_variance=1e-2
+        )
+    elif args.smoothing == 'kalman':
         print("Using Kalman filter for smoothing")
         position_filter = KalmanFilter(
             process_variance=1e-5,
@@ -119,15 +146,28 @@ def main():
     print("- Thumb Down (👎): Volume down")
     print("- Index + Middle + Ring Up: Brightness control")
     
+    # Capture frames on a background thread so the camera wait overlaps
+    # inference; gesture actions are sent from GestureMapper's worker thread
+    stream = CameraStream(cap).start()
+    
     # Main loop
-    prev_time = 0
     consecutive_failures = 0
     max_failures = 5
     
+    # Last raw index tip position fed to the filter and the filtered result
+    last_measurement = None
+    last_filtered = None
+    
+    # FPS over the last 30 frames, refreshed every 10 frames
+    frame_times = deque(maxlen=30)
+    frame_count = 0
+    fps_text = "FPS: 0"
+    camera_text = f"Camera: {args.camera}"
+    
     while True:
         try:
-            # Read frame from webcam
-            success, img = cap.read()
+            # Get the newest frame from the capture thread
+            success, img = stream.read()
             if not success:
                 consecutive_failures += 1
                 print(f"Failed to grab frame from camera. Attempt {consecutive_failures}/{max_failures}")
@@ -142,14 +182,14 @@ def main():
             img = cv2.flip(img, 1)
             
             # Find hands in the frame
-            img = detector.find_hands(img)
+            img = detector.find_hands(img, draw=args.show_landmarks)
             
             # Find landmark positions
-            landmarks = detector.find_position(img, draw=True)  # Changed to True to show landmarks
+            landmarks = detector.find_position(img, draw=args.show_landmarks)
             
             # Determine which fingers are up
             fingers = [0, 0, 0, 0, 0]  # Default to all down
-            if landmarks:
+            if len(landmarks):
                 fingers = detector.fingers_up(landmarks)
             
             # Get frame dimensions
@@ -163,35 +203,36 @@ def main():
             )
             
             # Apply additional smoothing if enabled
-            if position_filter is not None and landmarks and len(landmarks) > 8:
-                # Get index finger position
-                index_x, index_y = landmarks[8][1:]
+            if position_filter is not None and len(landmarks) > 8:
+                # Only step the filter when the index tip actually moved; a
+                # still hand reuses the previous filtered position
+                measurement = (landmarks[8, 1], landmarks[8, 2])
+                if measurement != last_measurement:
+                    last_measurement = measurement
+                    
+                    # All filters share update(measurement); the int32 row view is
+                    # passed straight through, and the copy keeps the cached result
+                    # independent of the filter state
+                    last_filtered = position_filter.update(landmarks[8, 1:]).copy()
                 
-                # Apply filter
-                if isinstance(position_filter, KalmanFilter):
-                    filtered_position = position_filter.update(np.array([index_x, index_y]))
-                    # Update landmark with filtered position
-                    landmarks[8][1] = int(filtered_position[0])
-                    landmarks[8][2] = int(filtered_position[1])
-                elif isinstance(position_filter, ExponentialMovingAverage):
-                    filtered_position = position_filter.update(np.array([index_x, index_y]))
-                    # Update landmark with filtered position
-                    landmarks[8][1] = int(filtered_position[0])
-                    landmarks[8][2] = int(filtered_position[1])
+                # Update landmark with filtered position (truncates like int())
+                landmarks[8, 1:] = last_filtered
             
             # Draw information panel on the frame
             img = draw_info_panel(img, mode, action, fingers)
             
             # Calculate and display FPS
-            current_time = time.time()
-            fps = 1 / (current_time - prev_time) if prev_time > 0 else 0
-            prev_time = current_time
+            frame_times.append(time.perf_counter())
+            frame_count += 1
+            if frame_count % 10 == 0 and len(frame_times) > 1:
+                fps = (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
+                fps_text = f"FPS: {int(fps)}"
             
-            cv2.putText(img, f"FPS: {int(fps)}", (10, frame_height - 20), 
+            cv2.putText(img, fps_text, (10, frame_height - 20), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
             
             # Add camera index display
-            cv2.putText(img, f"Camera: {args.camera}", (frame_width - 120, frame_height - 20),
+            cv2.putText(img, camera_text, (frame_width - 120, frame_height - 20),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
             
             # Display the resulting frame
@@ -206,6 +247,7 @@ def main():
             continue
     
     # Release resources
+    stream.stop()
     cap.release()
     cv2.destroyAllWindows()
     print("Application closed.")
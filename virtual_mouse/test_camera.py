@@ -1,6 +1,8 @@
 # type: ignore
 import cv2
 
+from utils import try_camera_indices
+
 def test_camera():
     # Try to open the camera
     print("Attempting to open camera...")
@@ -11,15 +13,8 @@ def test_camera():
         print("Error: Could not open webcam.")
         print("Trying alternative camera indices...")
         
-        # Try different camera indices
-        for i in range(1, 5):
-            print(f"Trying camera index {i}...")
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                print(f"Success! Camera opened with index {i}")
-                break
-            else:
-                print(f"Camera index {i} failed.")
+        # Probe the camera indices and reopen the first one that works
+        cap = cv2.VideoCapture(try_camera_indices())
         
         if not cap.isOpened():
             print("Could not open any camera. Please check your connections and permissions.")
@@ -1,7 +1,159 @@
 # type: ignore
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import cv2
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the kernels below then run as plain Python
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import simdkalman
+    HAVE_SIMDKALMAN = True
+except ImportError:  # simdkalman is optional; KalmanFilter below is the fallback
+    HAVE_SIMDKALMAN = False
+
+@njit(cache=True, fastmath=True)
+def ema_update(state, meas, alpha):
+    """
+    Blend a measurement into an EMA state in place
+    
+    Args:
+        state: float64 filter state, updated in place
+        meas: Measurement with the same length as state
+        alpha: Smoothing factor (0-1)
+        
+    Returns:
+        state
+    """
+    for i in range(state.shape[0]):
+        state[i] = alpha * meas[i] + (1.0 - alpha) * state[i]
+    return state
+
+@njit(cache=True, fastmath=True)
+def kalman_update(state, cov, F, Q, H, R, meas):
+    """
+    One Kalman predict/update step, written as plain loops over the small matrices
+    
+    Args:
+        state: float64 state vector (n,), updated in place
+        cov: float64 state covariance (n, n), updated in place
+        F: Transition matrix (n, n)
+        Q: Process covariance (n, n)
+        H: Measurement matrix (m, n)
+        R: Measurement covariance (m, m)
+        meas: Measurement (m,)
+        
+    Returns:
+        Filtered measurement H @ state as a new (m,) array
+    """
+    n = state.shape[0]
+    m = meas.shape[0]
+    
+    # Predict step: x = F x, P = F P F^T + Q
+    x = np.zeros(n)
+    FP = np.zeros((n, n))
+    P = Q.copy()
+    for i in range(n):
+        for k in range(n):
+            x[i] += F[i, k] * state[k]
+            for j in range(n):
+                FP[i, j] += F[i, k] * cov[k, j]
+    for i in range(n):
+        for j in range(n):
+            for k in range(n):
+                P[i, j] += FP[i, k] * F[j, k]
+    
+    # Innovation covariance S = H P H^T + R and cross term P H^T
+    PHt = np.zeros((n, m))
+    for i in range(n):
+        for j in range(m):
+            for k in range(n):
+                PHt[i, j] += P[i, k] * H[j, k]
+    S = R.copy()
+    for i in range(m):
+        for j in range(m):
+            for k in range(n):
+                S[i, j] += H[i, k] * PHt[k, j]
+    
+    # Invert S by Gauss-Jordan; S is symmetric positive definite, so no pivoting
+    S_inv = np.eye(m)
+    for c in range(m):
+        d = 1.0 / S[c, c]
+        for j in range(m):
+            S[c, j] *= d
+            S_inv[c, j] *= d
+        for r in range(m):
+            if r != c:
+                f = S[r, c]
+                for j in range(m):
+                    S[r, j] -= f * S[c, j]
+                    S_inv[r, j] -= f * S_inv[c, j]
+    
+    # Kalman gain K = P H^T S^-1
+    K = np.zeros((n, m))
+    for i in range(n):
+        for j in range(m):
+            for k in range(m):
+                K[i, j] += PHt[i, k] * S_inv[k, j]
+    
+    # Update step: x += K (z - H x)
+    innovation = np.empty(m)
+    for i in range(m):
+        innovation[i] = meas[i]
+        for k in range(n):
+            innovation[i] -= H[i, k] * x[k]
+    for i in range(n):
+        state[i] = x[i]
+        for k in range(m):
+            state[i] += K[i, k] * innovation[k]
+    
+    # Update state covariance: P = (I - K H) P
+    for i in range(n):
+        for j in range(n):
+            acc = P[i, j]
+            for k in range(m):
+                for l in range(n):
+                    acc -= K[i, k] * H[k, l] * P[l, j]
+            cov[i, j] = acc
+    
+    # Return filtered position
+    result = np.zeros(m)
+    for i in range(m):
+        for k in range(n):
+            result[i] += H[i, k] * state[k]
+    return result
+
+def _inv2x2(M, out):
+    """
+    Invert a 2x2 matrix in closed form, skipping LAPACK's setup cost
+    
+    Args:
+        M: 2x2 matrix
+        out: 2x2 float64 array the inverse is written into
+        
+    Returns:
+        out
+    """
+    a, b, c, d = M[0, 0], M[0, 1], M[1, 0], M[1, 1]
+    inv_det = 1.0 / (a * d - b * c)
+    out[0, 0] = d * inv_det
+    out[0, 1] = -b * inv_det
+    out[1, 0] = -c * inv_det
+    out[1, 1] = a * inv_det
+    return out
+
 class KalmanFilter:
     """
     A simple Kalman filter implementation for smoothing hand tracking
@@ -46,6 +198,23 @@ class KalmanFilter:
         
         # State covariance - uncertainty in the state estimation
         self.state_covariance = np.eye(2 * dimensions)
+        
+        # Constant transposes and preallocated workspace for update(); the
+        # matrices are tiny, so per-call allocation would dominate the cost
+        n = 2 * dimensions
+        self._transition_T = np.ascontiguousarray(self.transition_matrix.T)
+        self._measurement_T = np.ascontiguousarray(self.measurement_matrix.T)
+        self._identity = np.eye(n)
+        self._pred_state = np.empty(n)
+        self._pred_cov = np.empty((n, n))
+        self._tmp_nn = np.empty((n, n))
+        self._tmp_mn = np.empty((dimensions, n))
+        self._S = np.empty((dimensions, dimensions))
+        self._S_inv = np.empty((dimensions, dimensions))
+        self._PHt = np.empty((n, dimensions))
+        self._K = np.empty((n, dimensions))
+        self._I_KH = np.empty((n, n))
+        self._innovation = np.empty(dimensions)
     
     def update(self, measurement):
         """
@@ -57,31 +226,91 @@ class KalmanFilter:
         Returns:
             Filtered position [x, y, ...]
         """
+        if HAVE_NUMBA:
+            return kalman_update(self.state, self.state_covariance,
+                                 self.transition_matrix, self.process_covariance,
+                                 self.measurement_matrix, self.measurement_covariance,
+                                 measurement)
+        
         # Predict step
-        predicted_state = np.dot(self.transition_matrix, self.state)
-        predicted_state_cov = (np.dot(np.dot(self.transition_matrix, self.state_covariance), 
-                               self.transition_matrix.T) + self.process_covariance)
+        np.dot(self.transition_matrix, self.state, out=self._pred_state)
+        np.dot(self.transition_matrix, self.state_covariance, out=self._tmp_nn)
+        np.dot(self._tmp_nn, self._transition_T, out=self._pred_cov)
+        self._pred_cov += self.process_covariance
         
         # Calculate Kalman gain
-        innovation_cov = (np.dot(np.dot(self.measurement_matrix, predicted_state_cov), 
-                          self.measurement_matrix.T) + self.measurement_covariance)
-        kalman_gain = np.dot(np.dot(predicted_state_cov, self.measurement_matrix.T),
-                           np.linalg.inv(innovation_cov))
+        np.dot(self.measurement_matrix, self._pred_cov, out=self._tmp_mn)
+        np.dot(self._tmp_mn, self._measurement_T, out=self._S)
+        self._S += self.measurement_covariance
+        np.dot(self._pred_cov, self._measurement_T, out=self._PHt)
+        if self.dimensions == 2:
+            S_inv = _inv2x2(self._S, self._S_inv)
+        else:
+            S_inv = np.linalg.inv(self._S)
+        np.dot(self._PHt, S_inv, out=self._K)
         
         # Update step
-        innovation = measurement - np.dot(self.measurement_matrix, predicted_state)
-        self.state = predicted_state + np.dot(kalman_gain, innovation)
+        np.dot(self.measurement_matrix, self._pred_state, out=self._innovation)
+        np.subtract(measurement, self._innovation, out=self._innovation)
+        np.dot(self._K, self._innovation, out=self.state)
+        self.state += self._pred_state
         
         # Update state covariance
-        identity_matrix = np.eye(2 * self.dimensions)
-        self.state_covariance = np.dot((identity_matrix - 
-                                     np.dot(kalman_gain, self.measurement_matrix)), 
-                                     predicted_state_cov)
+        np.dot(self._K, self.measurement_matrix, out=self._I_KH)
+        np.subtract(self._identity, self._I_KH, out=self._I_KH)
+        np.dot(self._I_KH, self._pred_cov, out=self.state_covariance)
         
         # Return filtered position
         result = np.dot(self.measurement_matrix, self.state)
         return result
 
+class SimdKalmanFilter:
+    """
+    The KalmanFilter model run through simdkalman's vectorized kernels
+    
+    KalmanFilter's 2*dimensions state uses identity noise and no cross-axis
+    terms, so it splits exactly into one [position, velocity] filter per axis.
+    Those per-axis filters are stacked as a batch and stepped together.
+    """
+    def __init__(self, process_variance=1e-5, measurement_variance=1e-1, dimensions=2):
+        """
+        Initialize the filter with the same arguments as KalmanFilter
+        
+        Args:
+            process_variance: How fast the system state can change
+            measurement_variance: How noisy the measurements are
+            dimensions: Number of dimensions to track (typically 2 for x,y position)
+        """
+        self.process_variance = process_variance
+        self.measurement_variance = measurement_variance
+        self.dimensions = dimensions
+        
+        self.kf = simdkalman.KalmanFilter(
+            state_transition=np.array([[1.0, 1.0], [0.0, 1.0]]),
+            process_noise=np.eye(2) * process_variance,
+            observation_model=np.array([[1.0, 0.0]]),
+            observation_noise=np.array([[measurement_variance]]))
+        
+        # Batched per-axis state: means are (dimensions, 2, 1), covariances (dimensions, 2, 2)
+        self.state = np.zeros((dimensions, 2, 1))
+        self.state_covariance = np.tile(np.eye(2), (dimensions, 1, 1))
+        self._measurement = np.empty((dimensions, 1, 1))
+    
+    def update(self, measurement):
+        """
+        Update the Kalman filter with a new measurement
+        
+        Args:
+            measurement: numpy array of measurements [x, y, ...]
+            
+        Returns:
+            Filtered position [x, y, ...]
+        """
+        self._measurement[:, 0, 0] = measurement
+        prior_mean, prior_cov = self.kf.predict_next(self.state, self.state_covariance)
+        self.state, self.state_covariance = self.kf.update(prior_mean, prior_cov, self._measurement)[:2]
+        return self.state[:, 0, 0].copy()
+
 class ExponentialMovingAverage:
     """
     Simple exponential moving average filter
@@ -110,14 +339,295 @@ class ExponentialMovingAverage:
             Filtered measurement
         """
         if not self.initialized:
-            self.last_value = measurement
+            self.last_value[:] = measurement
             self.initialized = True
-            return measurement
+            return self.last_value
         
         # Calculate EMA
+        if HAVE_NUMBA:
+            return ema_update(self.last_value, measurement, self.alpha)
         self.last_value = self.alpha * measurement + (1 - self.alpha) * self.last_value
         return self.last_value
 
+class CameraStream:
+    """
+    Background camera reader that keeps only the newest frame
+    
+    Capturing on its own thread overlaps the camera wait with inference
+    on the main thread. Every frame is grabbed so the driver queue stays
+    drained. A frame is decoded whenever the main loop has already read the
+    last published one (or is waiting for one). Frames grabbed while a
+    decoded frame is still unread are dropped without paying for retrieve().
+    """
+    def __init__(self, cap):
+        """
+        Initialize the camera stream
+        
+        Args:
+            cap: Opened cv2.VideoCapture
+        """
+        self.cap = cap
+        self.latest_frame = None
+        self.latest_ok = False
+        self.stop_flag = False
+        self._frame_id = 0
+        self._read_id = 0
+        self._wanted = False
+        self._cond = threading.Condition()
+        self._back_buffer = None
+        self._thread = threading.Thread(target=self.run, daemon=True)
+    
+    def start(self):
+        """
+        Start the capture thread
+        
+        Returns:
+            self, for chaining
+        """
+        self._thread.start()
+        return self
+    
+    def run(self):
+        """
+        Capture loop; decodes and publishes a frame whenever the last one has been read
+        
+        Frames are decoded into a back buffer outside the lock and swapped
+        with the front buffer under it, so the buffer a reader copies from
+        is never being written.
+        """
+        while not self.stop_flag:
+            ok = self.cap.grab()
+            if ok and self._frame_id != self._read_id and not self._wanted:
+                continue  # A decoded frame is still unread; skip decoding this one
+            frame = None
+            if ok:
+                ok, frame = self.cap.retrieve(self._back_buffer)
+            with self._cond:
+                self.latest_ok = ok
+                if ok:
+                    self._back_buffer, self.latest_frame = self.latest_frame, frame
+                self._wanted = False
+                self._frame_id += 1
+                self._cond.notify_all()
+            if not ok:
+                time.sleep(0.1)
+    
+    def read(self, timeout=1.0):
+        """
+        Get the newest decoded frame not yet read, waiting only if there is none
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            (success, frame) like cv2.VideoCapture.read; the frame is a copy
+            the caller owns
+        """
+        with self._cond:
+            if self._frame_id == self._read_id:
+                self._wanted = True
+                if not self._cond.wait_for(lambda: self._frame_id != self._read_id, timeout):
+                    return False, None
+            self._read_id = self._frame_id
+            if not self.latest_ok:
+                return False, None
+            return True, self.latest_frame.copy()
+    
+    def stop(self):
+        """
+        Stop the capture thread and wait for it to exit
+        """
+        self.stop_flag = True
+        self._thread.join(timeout=1.0)
+
+def _probe_camera(index):
+    """
+    Check whether a camera index opens and delivers a frame
+    
+    Args:
+        index: Camera index to try
+        
+    Returns:
+        True if a frame could be read
+    """
+    cap = cv2.VideoCapture(index)
+    try:
+        if not cap.isOpened():
+            return False
+        ret, _ = cap.read()
+        return ret
+    finally:
+        cap.release()
+
+def try_camera_indices(max_index=5):
+    """
+    Try different camera indices to find a working camera
+    
+    All indices are probed in parallel, since opening a missing device can
+    block for a long time on some backends. The lowest working index wins,
+    as with a sequential search, but it is returned as soon as every lower
+    index has failed.
+    
+    Args:
+        max_index: Number of indices to try, starting at 0
+        
+    Returns:
+        The lowest working camera index, or 0 if no camera was found
+    """
+    print(f"Trying camera indices 0-{max_index - 1}...")
+    executor = ThreadPoolExecutor(max_workers=max_index)
+    try:
+        futures = [executor.submit(_probe_camera, i) for i in range(max_index)]
+        for i, future in enumerate(futures):
+            if future.result():
+                print(f"Success! Camera opened with index {i}")
+                return i
+            print(f"Camera index {i} failed.")
+    finally:
+        # Don't wait for slower probes of higher indices; they release their
+        # captures on their own
+        executor.shutdown(wait=False)
+    return 0  # Default to 0 if no camera found
+
+# Tip and PIP joint landmark indices for index, middle, ring and pinky,
+# and the bit each finger sets in the finger bitmask
+_FINGER_TIP_IDS = np.array([8, 12, 16, 20])
+_FINGER_PIP_IDS = np.array([6, 10, 14, 18])
+_FINGER_BITS = np.array([2, 4, 8, 16])
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def fingers_up_mask(lm):
+        """
+        Determine which fingers are up from a landmark array
+        
+        Args:
+            lm: int32 landmark array [id, x, y] with shape (21, 3)
+            
+        Returns:
+            Finger bitmask in the same layout as fingers_to_mask
+        """
+        mask = 0
+        
+        # Thumb: compare x position of tip with x position of thumb IP
+        if lm[4, 1] < lm[3, 1]:
+            mask |= 1
+        
+        # Other fingers: compare y position of tip with y position of PIP joint (2nd joint)
+        for k in range(4):
+            if lm[_FINGER_TIP_IDS[k], 2] < lm[_FINGER_PIP_IDS[k], 2]:
+                mask |= _FINGER_BITS[k]
+        return mask
+else:
+    def fingers_up_mask(lm):
+        """
+        Determine which fingers are up from a landmark array (NumPy version)
+        """
+        # One vectorized tip-vs-PIP compare for the four fingers
+        ups = lm[_FINGER_TIP_IDS, 2] < lm[_FINGER_PIP_IDS, 2]
+        return int(lm[4, 1] < lm[3, 1]) | int(_FINGER_BITS[ups].sum())
+
+@njit(cache=True)
+def pinch_distance_sq(lm, i, j):
+    """
+    Squared pixel distance between two landmarks
+    
+    Args:
+        lm: int32 landmark array [id, x, y]
+        i, j: Landmark indices
+        
+    Returns:
+        Squared distance as an integer
+    """
+    dx = lm[i, 1] - lm[j, 1]
+    dy = lm[i, 2] - lm[j, 2]
+    return dx * dx + dy * dy
+
+# Compile the kernels at import time instead of on the first hand frame
+_dummy_landmarks = np.zeros((21, 3), dtype=np.int32)
+fingers_up_mask(_dummy_landmarks)
+pinch_distance_sq(_dummy_landmarks, 4, 8)
+if HAVE_NUMBA:
+    KalmanFilter().update(_dummy_landmarks[8, 1:])
+    _ema = ExponentialMovingAverage()  # the first update only seeds the state
+    _ema.update(_dummy_landmarks[8, 1:])
+    _ema.update(_dummy_landmarks[8, 1:])
+    del _ema
+del _dummy_landmarks
+
+def fingers_to_mask(fingers):
+    """
+    Pack the five finger states into a bitmask
+    
+    Args:
+        fingers: List of 5 binary values [thumb, index, middle, ring, pinky]
+        
+    Returns:
+        Integer with bit 0 set for the thumb through bit 4 for the pinky
+    """
+    return fingers[0] | fingers[1] << 1 | fingers[2] << 2 | fingers[3] << 3 | fingers[4] << 4
+
+# Gesture descriptions for the info panel, keyed by fingers_to_mask bitmask
+# (bit 0 = thumb ... bit 4 = pinky)
+_GESTURE_NAMES = {
+    0b00010: "Index pointing (cursor move)",
+    0b00110: "Two fingers up (scroll)",
+    0b11111: "Open palm (switch to draw mode)",
+    0b00000: "Fist (switch to control mode)",
+    0b01110: "Three fingers up (brightness)",
+}
+
+# Actions whose gesture is named by the action rather than the finger pose
+_ACTION_GESTURE_NAMES = {
+    "right_click": "Three-finger pinch (right click)",
+    "volume_up": "Thumb up (volume up)",
+    "volume_down": "Thumb down (volume down)",
+}
+
+# Info panel colors (BGR) and font
+_WHITE = (255, 255, 255)
+_ORANGE = (245, 117, 16)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Pre-rendered panel backgrounds, keyed by mode description; the size
+# covers the inclusive (0, 0)-(300, 180) box the panel has always drawn
+_PANEL_SIZE = (181, 301)
+_PANEL_TEMPLATES = {}
+
+def _panel_template(mode_desc):
+    """
+    Get the static part of the info panel, rendering it on first use
+    
+    Args:
+        mode_desc: Mode description line drawn under the mode name
+        
+    Returns:
+        (181, 301, 3) uint8 image with the panel box, mode description and quit hint
+    """
+    template = _PANEL_TEMPLATES.get(mode_desc)
+    if template is None:
+        template = np.empty(_PANEL_SIZE + (3,), dtype=np.uint8)
+        template[:] = _ORANGE
+        cv2.putText(template, mode_desc, (10, 55), 
+                    _FONT, 0.6, _WHITE, 1)
+        cv2.putText(template, "Press 'q' to quit", (10, 175), 
+                    _FONT, 0.5, _WHITE, 1)
+        _PANEL_TEMPLATES[mode_desc] = template
+    return template
+
+@lru_cache(maxsize=16)
+def _format_action(action):
+    """
+    Format an action name for display, e.g. "left_click" -> "Left Click"
+    
+    Args:
+        action: Action name from the gesture mapper
+        
+    Returns:
+        Title-cased action name
+    """
+    return action.replace('_', ' ').title()
+
 def draw_info_panel(frame, mode, action, fingers):
     """
     Draw information overlay on the frame
@@ -131,15 +641,7 @@ def draw_info_panel(frame, mode, action, fingers):
     Returns:
         Frame with info overlay
     """
-    # Draw box in top-left corner
-    cv2.rectangle(frame, (0, 0), (300, 180), (245, 117, 16), -1)
-    
-    # Display mode with enhanced description
-    mode_text = f"Mode: {mode.capitalize()}"
-    cv2.putText(frame, mode_text, (10, 30), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-    
-    # Display more detailed mode description
+    # More detailed mode description, pre-rendered into the panel template
     if mode == "control":
         mode_desc = "Mouse & system control"
     elif mode == "draw":
@@ -147,57 +649,42 @@ def draw_info_panel(frame, mode, action, fingers):
     else:
         mode_desc = "Unknown mode"
     
-    cv2.putText(frame, mode_desc, (10, 55), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+    # Copy the static box into the top-left corner (clipped to small frames)
+    h = min(_PANEL_SIZE[0], frame.shape[0])
+    w = min(_PANEL_SIZE[1], frame.shape[1])
+    frame[:h, :w] = _panel_template(mode_desc)[:h, :w]
+    
+    # Display mode with enhanced description
+    mode_text = f"Mode: {mode.capitalize()}"
+    cv2.putText(frame, mode_text, (10, 30), 
+                _FONT, 0.7, _WHITE, 2)
     
     # Display action with descriptive text
     if action:
         # Format the action string for better display
-        action_formatted = action.replace('_', ' ').title()
-        action_text = f"Action: {action_formatted}"
+        action_text = f"Action: {_format_action(action)}"
     else:
         action_text = "Action: None"
     
     cv2.putText(frame, action_text, (10, 85), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                _FONT, 0.7, _WHITE, 2)
     
     # Display fingers up (1=up, 0=down) with labels
-    finger_names = ["Thumb", "Index", "Middle", "Ring", "Pinky"]
-    fingers_text = "Fingers: "
-    for i, finger in enumerate(fingers):
-        fingers_text += "1" if finger else "0"
-        if i < 4:
-            fingers_text += ","
+    fingers_text = f"Fingers: {fingers[0]:d},{fingers[1]:d},{fingers[2]:d},{fingers[3]:d},{fingers[4]:d}"
     
     cv2.putText(frame, fingers_text, (10, 115), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                _FONT, 0.7, _WHITE, 2)
     
-    # Display recognized hand gesture based on fingers state
-    gesture_name = "Unknown gesture"
-    if fingers == [0, 1, 0, 0, 0]:
-        gesture_name = "Index pointing (cursor move)"
-    elif fingers == [1, 1, 0, 0, 0] and action == "left_click":
+    # Display recognized hand gesture; action-specific names win over the pose,
+    # so e.g. a right click fired from the index-only cursor pose (which also
+    # checks pinches) is labelled as the pinch rather than "Index pointing"
+    mask = fingers_to_mask(fingers)
+    if action == "left_click" and mask == 0b00011:
         gesture_name = "Thumb-Index pinch (left click)"
-    elif action == "right_click":
-        gesture_name = "Three-finger pinch (right click)"
-    elif fingers == [0, 1, 1, 0, 0]:
-        gesture_name = "Two fingers up (scroll)"
-    elif fingers == [1, 1, 1, 1, 1]:
-        gesture_name = "Open palm (switch to draw mode)"
-    elif fingers == [0, 0, 0, 0, 0]:
-        gesture_name = "Fist (switch to control mode)"
-    elif action == "volume_up":
-        gesture_name = "Thumb up (volume up)"
-    elif action == "volume_down":
-        gesture_name = "Thumb down (volume down)"
-    elif fingers == [0, 1, 1, 1, 0]:
-        gesture_name = "Three fingers up (brightness)"
+    else:
+        gesture_name = _ACTION_GESTURE_NAMES.get(action) or _GESTURE_NAMES.get(mask, "Unknown gesture")
     
     cv2.putText(frame, f"Gesture: {gesture_name}", (10, 145), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-    
-    # Helper tip
-    cv2.putText(frame, "Press 'q' to quit", (10, 175), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                _FONT, 0.6, _WHITE, 1)
     
     return frame 
\ No newline at end of file